@@ -15,11 +15,12 @@ from email.mime.multipart import MIMEMultipart
 from email.header import decode_header
 from datetime import datetime, timedelta
 import base64
-import pandas as pd
 from typing import List, Dict, Any, Optional
 import logging
 from pathlib import Path
 
+from utils.helpers import extract_pdf_text
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -31,6 +32,16 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Position mentions in an email body, tried in order
+POSITION_PATTERNS = [
+    re.compile(p, re.IGNORECASE) for p in (
+        r'applying for\s+(.+)position',
+        r'position\s+of\s+(.+)',
+        r'job\s+(.+)application',
+        r'role\s+of\s+(.+)'
+    )
+]
+
 class EmailAgent:
     """Email agent that checks, downloads, and processes resumes"""
     
@@ -429,15 +440,8 @@ class EmailAgent:
                 break
         
         # Try to extract position applied for
-        position_patterns = [
-            r'applying for\s+(.+)position',
-            r'position\s+of\s+(.+)',
-            r'job\s+(.+)application',
-            r'role\s+of\s+(.+)'
-        ]
-        
-        for pattern in position_patterns:
-            match = re.search(pattern, email_body.lower())
+        for pattern in POSITION_PATTERNS:
+            match = pattern.search(email_body)
             if match:
                 info["position_applied"] = match.group(1).strip().title()
                 break
@@ -446,8 +450,9 @@ class EmailAgent:
         if not info["position_applied"]:
             common_roles = ["software engineer", "developer", "data scientist", 
                            "devops", "manager", "analyst", "designer"]
+            body_lower = email_body.lower()
             for role in common_roles:
-                if role in email_body.lower():
+                if role in body_lower:
                     info["position_applied"] = role.title()
                     break
         
@@ -552,13 +557,11 @@ class EmailAgent:
         """Read resume file based on extension"""
         try:
             if filepath.endswith('.pdf'):
-                import pdfplumber
-                with pdfplumber.open(filepath) as pdf:
-                    text = "\n".join([page.extract_text() or "" for page in pdf.pages])
+                text = extract_pdf_text(filepath)
             elif filepath.endswith('.docx'):
                 from docx import Document
                 doc = Document(filepath)
-                text = "\n".join([para.text for para in doc.paragraphs])
+                text = "\n".join(t for para in doc.paragraphs if (t := para.text))
             elif filepath.endswith('.txt'):
                 with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
                     text = f.read()
@@ -649,6 +652,7 @@ class EmailAgent:
             })
         
         if csv_data:
+            import pandas as pd
             df = pd.DataFrame(csv_data)
             csv_file = os.path.join(self.results_dir, f"email_summary_{timestamp}.csv")
             df.to_csv(csv_file, index=False)
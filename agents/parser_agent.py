@@ -4,9 +4,12 @@ import re
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass
-import pdfplumber
-from docx import Document
-import PyPDF2
+
+from utils.helpers import extract_pdf_text
+
+_WHITESPACE_RE = re.compile(r'\s+')
+_SPECIAL_CHARS_RE = re.compile(r'[^\w\s.,;:!?()-]')
+_SENTENCE_END_RE = re.compile(r'(?<=[.!?])\s+')
 
 @dataclass
 class ResumeData:
@@ -60,26 +63,21 @@ class ResumeParserAgent:
     
     def _parse_pdf(self, file_path: str) -> str:
         """Parse PDF file"""
-        text = ""
-        
-        # Try pdfplumber first (better for structured text)
+        # PyMuPDF when installed, then pdfplumber
         try:
-            with pdfplumber.open(file_path) as pdf:
-                for page in pdf.pages:
-                    text += page.extract_text() + "\n"
+            return extract_pdf_text(file_path)
         except:
             # Fallback to PyPDF2
+            import PyPDF2
             with open(file_path, 'rb') as file:
                 pdf_reader = PyPDF2.PdfReader(file)
-                for page in pdf_reader.pages:
-                    text += page.extract_text() + "\n"
-        
-        return text
+                return "\n".join(page.extract_text() or "" for page in pdf_reader.pages)
     
     def _parse_docx(self, file_path: str) -> str:
         """Parse DOCX file"""
+        from docx import Document
         doc = Document(file_path)
-        text = "\n".join([paragraph.text for paragraph in doc.paragraphs])
+        text = "\n".join(t for paragraph in doc.paragraphs if (t := paragraph.text))
         return text
     
     def _parse_text(self, file_path: str) -> str:
@@ -91,9 +89,9 @@ class ResumeParserAgent:
     def _clean_text(self, text: str) -> str:
         """Clean and normalize text"""
         # Remove multiple spaces
-        text = re.sub(r'\s+', ' ', text)
+        text = _WHITESPACE_RE.sub(' ', text)
         # Remove special characters but keep basic punctuation
-        text = re.sub(r'[^\w\s.,;:!?()-]', ' ', text)
+        text = _SPECIAL_CHARS_RE.sub(' ', text)
         # Normalize line endings
         text = text.replace('\r\n', '\n').replace('\r', '\n')
         return text.strip()
@@ -101,8 +99,17 @@ class ResumeParserAgent:
     def _segment_sentences(self, text: str) -> List[str]:
         """Segment text into sentences"""
         # Simple segmentation (can be enhanced with NLTK/spaCy)
-        sentences = re.split(r'(?<=[.!?])\s+', text)
-        return [s.strip() for s in sentences if s.strip()]
+        return list(self._iter_sentences(text))
+    
+    def _iter_sentences(self, text: str):
+        """Yield non-empty sentences one at a time, without materializing a split list"""
+        start = 0
+        for match in _SENTENCE_END_RE.finditer(text):
+            if sentence := text[start:match.start()].strip():
+                yield sentence
+            start = match.end()
+        if sentence := text[start:].strip():
+            yield sentence
     
     def _extract_metadata(self, text: str, path: Path) -> Dict:
         """Extract basic metadata"""
@@ -110,7 +117,7 @@ class ResumeParserAgent:
             "filename": path.name,
             "filesize": path.stat().st_size,
             "word_count": len(text.split()),
-            "sentence_count": len(self._segment_sentences(text))
+            "sentence_count": sum(1 for _ in self._iter_sentences(text))
         }
     
     def save_to_json(self, resume_data: ResumeData, output_path: Optional[str] = None) -> str:
@@ -1,4 +1,5 @@
 import os
+import re
 import json
 from typing import List, Dict, Any, Optional
 from tqdm import tqdm
@@ -7,6 +8,7 @@ import time
 
 # Import configuration
 from config import model_config, agent_config, data_config
+from core.screener import trie_regex
 
 # Import Agents
 try:
@@ -23,6 +25,26 @@ except ImportError:
     from agents.grader_agent import HRGraderAgent
     from agents.decision_agent import DecisionMakerAgent
 
+# Common tech skills, matched in one pass (longest first)
+COMMON_SKILLS = [
+    "python", "java", "javascript", "aws", "docker", "kubernetes", "sql", 
+    "react", "node.js", "tensorflow", "pytorch", "machine learning", "ai", 
+    "cloud", "devops", "azure", "gcp", "linux", "git", "c++", "c#", "go", "rust"
+]
+COMMON_SKILLS_RE = re.compile(
+    r'\b(' + trie_regex(COMMON_SKILLS) + r')\b',
+    re.IGNORECASE
+)
+# Basic required skills per position, for the rule-based match percentage
+POSITION_REQUIREMENTS = {
+    "software_engineer": frozenset({"python", "java", "javascript", "sql"}),
+    "data_scientist": frozenset({"python", "machine learning", "sql", "tensorflow"}),
+    "devops": frozenset({"aws", "docker", "linux", "kubernetes"}),
+    "full_stack": frozenset({"javascript", "react", "node.js", "html"})
+}
+
+EXPERIENCE_RE = re.compile(r'(\d+)\s*years?\s*(?:of)?\s*experience', re.IGNORECASE)
+
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -158,8 +180,9 @@ class LLMScreener:
             logger.error(f"Folder not found: {folder_path}")
             return []
             
-        files = [os.path.join(folder_path, f) for f in os.listdir(folder_path) 
-                if f.lower().endswith(('.pdf', '.docx', '.txt', '.doc'))]
+        with os.scandir(folder_path) as it:
+            files = [entry.path for entry in it
+                     if entry.is_file() and entry.name.lower().endswith(('.pdf', '.docx', '.txt', '.doc'))]
         
         logger.info(f"📂 Batch processing {len(files)} resumes from {folder_path}")
         
@@ -184,45 +207,25 @@ class LLMScreener:
 
     def _extract_skills_rule_based(self, text: str) -> List[str]:
         """Extract skills using regex (reused from original screener)"""
-        # Common tech skills
-        common_skills = [
-            "python", "java", "javascript", "aws", "docker", "kubernetes", "sql", 
-            "react", "node.js", "tensorflow", "pytorch", "machine learning", "ai", 
-            "cloud", "devops", "azure", "gcp", "linux", "git", "c++", "c#", "go", "rust"
-        ]
-        text_lower = text.lower()
-        found = []
-        import re
-        for skill in common_skills:
-            if re.search(r'\b' + re.escape(skill) + r'\b', text_lower):
-                found.append(skill)
-        return found
+        hits = {m.group(1).lower() for m in COMMON_SKILLS_RE.finditer(text)}
+        return [skill for skill in COMMON_SKILLS if skill in hits]
 
     def _extract_experience_rule_based(self, text: str) -> float:
         """Extract experience years using regex"""
-        import re
-        text_lower = text.lower()
         # Look for "X years experience"
-        match = re.search(r'(\d+)\s*years?\s*(?:of)?\s*experience', text_lower)
+        match = EXPERIENCE_RE.search(text)
         if match:
             return float(match.group(1))
         return 0.0
 
     def _calculate_match(self, skills: List[str], position: str) -> int:
         """Simple skill match percentage"""
-        # Define some basic requirements
-        requirements = {
-            "software_engineer": ["python", "java", "javascript", "sql"],
-            "data_scientist": ["python", "machine learning", "sql", "tensorflow"],
-            "devops": ["aws", "docker", "linux", "kubernetes"],
-            "full_stack": ["javascript", "react", "node.js", "html"]
-        }
-        reqs = requirements.get(position.lower(), [])
+        reqs = POSITION_REQUIREMENTS.get(position.lower())
         if not reqs:
             return 0
         
-        matches = [s for s in skills if s in reqs]
-        return int((len(matches) / len(reqs)) * 100)
+        matches = sum(1 for s in skills if s in reqs)
+        return int((matches / len(reqs)) * 100)
 
     # --- Compatibility Methods for EmailScreener ---
     
@@ -4,18 +4,108 @@ With more realistic scoring (70-95 range instead of all 100s)
 """
 
 import os
+import sys
+import csv
 import json
 import re
-import pdfplumber
-from docx import Document
+import hashlib
+import pickle
+import zipfile
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from operator import itemgetter
+from pathlib import Path
 from typing import List, Dict, Any
-import pandas as pd
+from xml.etree import ElementTree
 from datetime import datetime
 
+from utils.helpers import extract_pdf_text
+
+# Degree levels in priority order; one pass over the text finds the best one.
+# Abbreviations (MS, M.S., MSc, BS, B.S., BSc) are word-bounded so they don't
+# match inside other words.
+DEGREE_RE = re.compile(
+    r'\b(?:(?P<phd>phd|doctorate)|(?P<ms>master|m\.?sc\b|m\.?s\b)'
+    r'|(?P<bs>bachelor|b\.?sc\b|b\.?tech|b\.?s\b)|(?P<edu>education))',
+    re.IGNORECASE
+)
+_DEGREE_POINTS = {"phd": 15, "ms": 10, "bs": 7, "edu": 5}
+
+_YEARS_EXP_RE = re.compile(r'(\d+)\s*years?\s*(?:of)?\s*experience', re.IGNORECASE)
+_DATE_RANGE_RE = re.compile(r'(?:19|20)\d{2}[-\s]\s*(?:19|20)\d{2}')
+_STATED_YEARS_RE = re.compile(r'(\d+)\s+years?\s+experience', re.IGNORECASE)
+_YEAR_RE = re.compile(r'(?:19|20)\d{2}')
+_SENIOR_RE = re.compile(r'\b(senior|lead|principal|manager|director)\b', re.IGNORECASE)
+
+_DEVELOPER_SKILLS = frozenset({"python", "java", "javascript"})
+_ML_SKILLS = frozenset({"machine learning", "ai", "tensorflow", "pytorch"})
+_DEVOPS_SKILLS = frozenset({"aws", "docker", "kubernetes", "cloud"})
+
+_WORD_RE = re.compile(r'\S+')
+
+# WordprocessingML tags read directly from a .docx's word/document.xml
+_W_NS = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+_W_PARAGRAPH, _W_RUN, _W_TEXT = _W_NS + 'p', _W_NS + 'r', _W_NS + 't'
+_W_RUN_SPECIALS = {_W_NS + 'tab': '\t', _W_NS + 'br': '\n', _W_NS + 'cr': '\n'}
+# Word stores text boxes twice (mc:Choice and a VML mc:Fallback copy); only the first is read
+_MC_FALLBACK = '{http://schemas.openxmlformats.org/markup-compatibility/2006}Fallback'
+
+# Experience points by years: <1, 1-2, 3-4, 5-9, 10+
+_YEARS_EDGES = [1, 3, 5, 10]
+_YEARS_POINTS = [0, 5, 8, 12, 15]
+
+def trie_regex(words):
+    """
+    Alternation of `words` factored into a prefix trie, so each text position
+    walks one branch instead of trying every word. Greedy optional groups keep
+    the longest-first preference of a sorted alternation.
+    """
+    trie = {}
+    for word in words:
+        node = trie
+        for ch in word.lower():
+            node = node.setdefault(ch, {})
+        node[''] = True
+    
+    def build(node):
+        branches = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        return '(?:' + body + ')?' if '' in node else body
+    
+    return build(trie)
+
+def summarize_words(text, limit):
+    """Return (first `limit` words joined, total word count) without splitting the whole text"""
+    words = _WORD_RE.finditer(text)
+    summary_words = [m.group() for m in islice(words, limit)]
+    if len(summary_words) < limit:
+        return " ".join(summary_words), len(summary_words)
+    
+    remaining = sum(1 for _ in words)
+    summary = " ".join(summary_words) + ("..." if remaining else "")
+    return summary, limit + remaining
+
+# Version of the on-disk cache format and of everything that feeds it (text
+# extraction, features, scoring). Bump it when any of those change so cached
+# results from older code are thrown away instead of being reused.
+CACHE_VERSION = 2
+_CACHE_SECTIONS = ("text", "features", "details")
+
+def _text_key(text):
+    """Cache key for a resume's text"""
+    return hashlib.sha1(text.encode('utf-8', errors='ignore')).hexdigest()
+
+def _file_key(file_path, stat):
+    """Cache key for a file that changes whenever its contents could have"""
+    return (os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size)
+
 class RealisticResumeScreener:
     """Realistic resume screening with better scoring"""
     
-    def __init__(self):
+    def __init__(self, cache_file="./.cache/screen.pkl"):
         # More realistic skill weights (max 40 points total)
         self.skill_weights = {
             "python": 8, "java": 8, "javascript": 6, "aws": 10, "docker": 8,
@@ -33,19 +123,62 @@ class RealisticResumeScreener:
             "devops": ["aws", "docker", "kubernetes", "linux", "git", "cloud"],
             "full_stack": ["python", "javascript", "react", "node.js", "aws", "docker"]
         }
+        
+        # Keyword lists used by the grader
+        self.top_universities = ["stanford", "mit", "harvard", "caltech", "princeton", 
+                                 "cambridge", "oxford", "carnegie", "berkeley"]
+        self.faang_companies = ["google", "microsoft", "amazon", "facebook", "apple", 
+                                "netflix", "meta", "tesla", "spacex", "uber", "airbnb"]
+        self.achievement_keywords = ["achievement", "award", "published", "patent", 
+                                     "improved", "increased", "reduced", "optimized"]
+        
+        # Intern all keyword constants so lookups hit the identity fast path
+        self.skill_weights = {sys.intern(k): v for k, v in self.skill_weights.items()}
+        self.position_requirements = {
+            position: [sys.intern(skill) for skill in skills]
+            for position, skills in self.position_requirements.items()
+        }
+        self.top_universities = [sys.intern(k) for k in self.top_universities]
+        self.faang_companies = [sys.intern(k) for k in self.faang_companies]
+        self.achievement_keywords = [sys.intern(k) for k in self.achievement_keywords]
+        
+        # Constants for the per-position scoring step
+        self._max_possible_skills = sum(sorted(self.skill_weights.values(), reverse=True)[:10])  # Top 10 skills
+        self._required_sets = {
+            position: frozenset(skills) for position, skills in self.position_requirements.items()
+        }
+        
+        # All skills as one alternation (longest first) so a single scan finds every hit
+        self._skills_re = re.compile(
+            r'\b(' + trie_regex(self.skill_weights) + r')\b',
+            re.IGNORECASE
+        )
+        
+        # Plain-substring keywords checked by the grader, found in one scan
+        keywords = (["experience", "certification", "certified"] + self.top_universities
+                    + self.faang_companies + self.achievement_keywords)
+        self._keywords_re = re.compile(
+            trie_regex(keywords),
+            re.IGNORECASE
+        )
+        
+        # Parsed text and base features of scanned folders survive across runs.
+        # Only process_folder uses this cache; grade_resume never loads or fills it.
+        self.cache_file = cache_file
+        self._cache = None
     
     def parse_resume(self, file_path):
         """Read resume file"""
         try:
             if file_path.endswith('.pdf'):
-                with pdfplumber.open(file_path) as pdf:
-                    text = "\n".join([page.extract_text() or "" for page in pdf.pages])
+                text = self._read_pdf(file_path)
             elif file_path.endswith('.docx'):
-                doc = Document(file_path)
-                text = "\n".join([para.text for para in doc.paragraphs])
+                text = self._read_docx(file_path)
             elif file_path.endswith('.txt'):
-                with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    text = f.read()
+                # Skip empty files without opening them
+                if os.stat(file_path).st_size == 0:
+                    return None
+                text = Path(file_path).read_bytes().decode('utf-8', errors='ignore')
             else:
                 return None
             return text.strip()
@@ -53,118 +186,173 @@ class RealisticResumeScreener:
             print(f"    Error reading {file_path}: {str(e)}")
             return None
     
+    def parse_resume_stream(self, fp, ext):
+        """Read resume text from a binary file object (e.g. an upload) without touching disk"""
+        try:
+            if ext == '.pdf':
+                text = self._read_pdf(fp)
+            elif ext == '.docx':
+                text = self._read_docx(fp)
+            elif ext == '.txt':
+                text = fp.read().decode('utf-8', errors='ignore')
+            else:
+                return None
+            return text.strip()
+        except Exception as e:
+            print(f"    Error reading {ext} stream: {str(e)}")
+            return None
+    
+    def _read_pdf(self, source):
+        """Extract PDF text with PyMuPDF, falling back to pdfplumber if it is missing or fails"""
+        return extract_pdf_text(source)
+    
+    def _read_docx(self, source):
+        """
+        Extract DOCX paragraph text from a path or binary file object.
+        
+        Streams word/document.xml instead of building python-docx's object
+        model; runs are joined per paragraph, tabs/breaks kept as in para.text.
+        """
+        paragraphs = []
+        stack = []      # text parts of the open (possibly nested) paragraphs
+        run_depth = 0   # tabs/breaks only count inside runs, not in tab stop definitions
+        fallback_depth = 0
+        with zipfile.ZipFile(source) as docx, docx.open('word/document.xml') as xml:
+            for event, elem in ElementTree.iterparse(xml, events=("start", "end")):
+                tag = elem.tag
+                if tag == _MC_FALLBACK:
+                    fallback_depth += 1 if event == "start" else -1
+                    continue
+                if fallback_depth:
+                    continue
+                
+                if event == "start":
+                    if tag == _W_PARAGRAPH:
+                        stack.append([])
+                    elif tag == _W_RUN:
+                        run_depth += 1
+                    continue
+                
+                if tag == _W_TEXT:
+                    if stack and elem.text:
+                        stack[-1].append(elem.text)
+                elif tag == _W_RUN:
+                    run_depth -= 1
+                elif tag == _W_PARAGRAPH:
+                    if text := "".join(stack.pop()):
+                        paragraphs.append(text)
+                    elem.clear()
+                elif run_depth and stack and tag in _W_RUN_SPECIALS:
+                    stack[-1].append(_W_RUN_SPECIALS[tag])
+        return "\n".join(paragraphs)
+    
     def grade_resume(self, text, target_position="software_engineer"):
         """Realistic grading algorithm (based on paper methodology)"""
         if not text:
             return 0, []
         
-        text_lower = text.lower()
-        score = 40  # Base score (lower starting point)
+        features = self._extract_features(text)
+        return self._apply_position(features, target_position)
+    
+    def _base_features(self, text):
+        """_extract_features, cached by text hash for process_folder"""
+        key = _text_key(text)
+        cache = self._load_cache()["features"]
+        if key not in cache:
+            cache[key] = self._extract_features(text)
+        return cache[key]
+    
+    def _extract_features(self, text):
+        """Position-independent scoring components"""
+        keyword_hits = {m.group().lower() for m in self._keywords_re.finditer(text)}
         
         # 1. Experience Section (max 25 points)
         experience_score = 0
         
         # Check for experience section
-        if "experience" in text_lower:
+        if "experience" in keyword_hits:
             experience_score += 10
             
             # Count years of experience (more realistic)
-            year_matches = re.findall(r'(\d+)\s*years?\s*(?:of)?\s*experience', text_lower)
+            year_matches = [m.group(1) for m in islice(_YEARS_EXP_RE.finditer(text), 3)]  # Take first 3 mentions
             if year_matches:
-                years = sum(int(match) for match in year_matches[:3])  # Take first 3 mentions
-                if years >= 10:
-                    experience_score += 15
-                elif years >= 5:
-                    experience_score += 12
-                elif years >= 3:
-                    experience_score += 8
-                elif years >= 1:
-                    experience_score += 5
+                years = sum(int(match) for match in year_matches)
+                experience_score += _YEARS_POINTS[bisect_right(_YEARS_EDGES, years)]
             else:
                 # Estimate from dates
-                date_patterns = re.findall(r'(?:19|20)\d{2}[-\s]\s*(?:19|20)\d{2}', text)
-                if date_patterns:
+                if _DATE_RANGE_RE.search(text):
                     experience_score += 7
         
         # Check for senior/lead roles
-        if re.search(r'\b(senior|lead|principal|manager|director)\b', text_lower):
+        if _SENIOR_RE.search(text):
             experience_score += 8
         
-        score += min(experience_score, 25)  # Cap experience at 25 points
-        
         # 2. Education (max 15 points)
         education_score = 0
         
-        if "phd" in text_lower or "doctorate" in text_lower:
-            education_score += 15
-        elif "master" in text_lower or "ms" in text_lower or "m.sc" in text_lower:
-            education_score += 10
-        elif "bachelor" in text_lower or "bs" in text_lower or "b.tech" in text_lower:
-            education_score += 7
-        elif "education" in text_lower:
-            education_score += 5
+        for match in DEGREE_RE.finditer(text):
+            education_score = max(education_score, _DEGREE_POINTS[match.lastgroup])
+            if match.lastgroup == "phd":
+                break  # Highest level, no need to keep scanning
         
         # Check for top universities
-        top_universities = ["stanford", "mit", "harvard", "caltech", "princeton", 
-                          "cambridge", "oxford", "carnegie", "berkeley"]
-        for uni in top_universities:
-            if uni in text_lower:
+        for uni in self.top_universities:
+            if uni in keyword_hits:
                 education_score += 3
         
-        score += min(education_score, 15)  # Cap education at 15 points
-        
-        # 3. Skills with weights (max 30 points)
-        skills_found = []
-        skills_score = 0
-        
-        # Get required skills for target position
-        required_skills = self.position_requirements.get(target_position, [])
-        
-        for skill, weight in self.skill_weights.items():
-            if re.search(r'\b' + re.escape(skill) + r'\b', text_lower):
-                skills_found.append(skill)
-                skills_score += weight
-                
-                # Bonus for required skills
-                if skill in required_skills:
-                    skills_score += 2  # Small bonus for required skills
-        
-        # Normalize skills score to max 30
-        max_possible_skills = sum(sorted(self.skill_weights.values(), reverse=True)[:10])  # Top 10 skills
-        if max_possible_skills > 0:
-            skills_score_normalized = (skills_score / max_possible_skills) * 30
-            score += skills_score_normalized
+        # 3. Skills with weights (position bonus applied later)
+        hits = {m.group(1).lower() for m in self._skills_re.finditer(text)}
+        skills_found = [skill for skill in self.skill_weights if skill in hits]
+        skills_score = sum(self.skill_weights[skill] for skill in skills_found)
         
         # 4. Company reputation (max 10 points)
         company_score = 0
-        faang_companies = ["google", "microsoft", "amazon", "facebook", "apple", 
-                          "netflix", "meta", "tesla", "spacex", "uber", "airbnb"]
-        for company in faang_companies:
-            if company in text_lower:
+        for company in self.faang_companies:
+            if company in keyword_hits:
                 company_score += 3
         
-        score += min(company_score, 10)  # Cap company at 10 points
-        
         # 5. Certifications (max 5 points)
-        if "certification" in text_lower or "certified" in text_lower:
-            score += 3
+        certification_score = 0
+        if "certification" in keyword_hits or "certified" in keyword_hits:
+            certification_score = 3
         
         # 6. Projects/Achievements (max 10 points)
-        achievement_keywords = ["achievement", "award", "published", "patent", 
-                              "improved", "increased", "reduced", "optimized"]
-        achievement_count = sum(1 for keyword in achievement_keywords if keyword in text_lower)
-        score += min(achievement_count * 2, 10)
+        achievement_count = sum(1 for keyword in self.achievement_keywords if keyword in keyword_hits)
+        
+        return {
+            # Base score (lower starting point) plus capped experience/education
+            "pre_skills_score": 40 + min(experience_score, 25) + min(education_score, 15),
+            "post_skills_score": min(company_score, 10) + certification_score + min(achievement_count * 2, 10),
+            "skills": skills_found,
+            "skills_score": skills_score
+        }
+    
+    def _apply_position(self, features, target_position):
+        """Add the position-dependent components to cached base features"""
+        score = features["pre_skills_score"]
+        skills_found = list(features["skills"])
+        
+        skills_set = frozenset(skills_found)
+        
+        # Small bonus for required skills
+        required_skills = self._required_sets.get(target_position, frozenset())
+        skills_score = features["skills_score"] + 2 * len(skills_set & required_skills)
+        
+        # Normalize skills score to max 30
+        if self._max_possible_skills > 0:
+            skills_score_normalized = (skills_score / self._max_possible_skills) * 30
+            score += skills_score_normalized
+        
+        score += features["post_skills_score"]
         
         # Apply position-specific adjustments
         if target_position == "data_scientist":
             # Data scientists need more ML/AI skills
-            ml_skills = [s for s in skills_found if s in ["machine learning", "ai", "tensorflow", "pytorch"]]
-            if len(ml_skills) >= 2:
+            if len(skills_set & _ML_SKILLS) >= 2:
                 score += 5
         elif target_position == "devops":
             # DevOps need cloud and container skills
-            devops_skills = [s for s in skills_found if s in ["aws", "docker", "kubernetes", "cloud"]]
-            if len(devops_skills) >= 3:
+            if len(skills_set & _DEVOPS_SKILLS) >= 3:
                 score += 5
         
         # Cap at 95 (never perfect) and minimum of 30
@@ -172,6 +360,81 @@ class RealisticResumeScreener:
         
         return round(final_score), skills_found
     
+    def _load_cache(self):
+        """Load the on-disk parse/grade cache once per instance"""
+        if self._cache is None:
+            self._cache = {section: {} for section in _CACHE_SECTIONS}
+            if self.cache_file:
+                try:
+                    with open(self.cache_file, 'rb') as f:
+                        data = pickle.load(f)
+                except Exception:
+                    data = None
+                # Caches written by other versions (or without one) are discarded
+                if isinstance(data, dict) and data.get("version") == CACHE_VERSION:
+                    self._cache.update((section, data[section]) for section in _CACHE_SECTIONS if section in data)
+        return self._cache
+    
+    def save_cache(self):
+        """Persist the parse/grade cache for the next run"""
+        if self._cache is None or not self.cache_file:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
+            with open(self.cache_file, 'wb') as f:
+                pickle.dump({"version": CACHE_VERSION, **self._cache}, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            print(f"    Could not save cache: {str(e)}")
+    
+    def parse_resume_cached(self, file_path, stat=None):
+        """parse_resume, reusing text from earlier runs while the file is unchanged"""
+        key = _file_key(file_path, stat or os.stat(file_path))
+        cache = self._load_cache()["text"]
+        if key not in cache:
+            cache[key] = self.parse_resume(file_path)
+        return cache[key]
+    
+    def _parse_in_parallel(self, entries):
+        """Parse uncached resumes and extract their base features in worker processes"""
+        cache = self._load_cache()
+        pending = {}
+        for entry in entries:
+            key = _file_key(entry.path, entry.stat())
+            if key not in cache["text"]:
+                pending[entry.path] = key
+        
+        # A pool only pays off when there is more than one file to parse
+        if len(pending) < 2:
+            return
+        
+        paths = list(pending)
+        with ProcessPoolExecutor() as executor:
+            for path, (text, features) in zip(paths, executor.map(_parse_and_extract, paths, chunksize=4)):
+                cache["text"][pending[path]] = text
+                if text:
+                    cache["features"][_text_key(text)] = features
+    
+    def _prune_cache(self, file_keys):
+        """Keep only cache entries for the given files (drops deleted or modified ones)"""
+        cache = self._load_cache()
+        cache["text"] = {key: text for key, text in cache["text"].items() if key in file_keys}
+        text_keys = {_text_key(text) for text in cache["text"].values() if text}
+        for section in ("features", "details"):
+            cache[section] = {key: value for key, value in cache[section].items() if key in text_keys}
+    
+    def _resume_details(self, text):
+        """Position-independent result fields (cached by text hash)"""
+        key = _text_key(text)
+        cache = self._load_cache()["details"]
+        if key not in cache:
+            summary, word_count = summarize_words(text, 120)
+            cache[key] = {
+                "summary": summary,
+                "word_count": word_count,
+                "years_experience": self.extract_experience(text)
+            }
+        return cache[key]
+    
     def process_folder(self, folder_path, target_position="software_engineer"):
         """Process all resumes in folder"""
         results = []
@@ -183,68 +446,68 @@ class RealisticResumeScreener:
         print(f"\n📂 Processing resumes from: {folder_path}")
         print(f"🎯 Target position: {target_position.replace('_', ' ').title()}")
         
-        for filename in os.listdir(folder_path):
-            if filename.endswith(('.pdf', '.docx', '.txt')):
-                file_path = os.path.join(folder_path, filename)
-                print(f"  📄 Analyzing: {filename}")
-                
-                text = self.parse_resume(file_path)
-                if text:
-                    grade, skills = self.grade_resume(text, target_position)
-                    
-                    # Extract years of experience
-                    years_exp = 0
-                    year_match = re.search(r'(\d+)\s+years?\s+experience', text.lower())
-                    if year_match:
-                        years_exp = int(year_match.group(1))
-                    else:
-                        # Try to estimate from dates
-                        year_pattern = r'(?:19|20)\d{2}'
-                        years = re.findall(year_pattern, text)
-                        if len(years) >= 2:
-                            try:
-                                years_numeric = [int(y) for y in years if 1900 <= int(y) <= 2024]
-                                if years_numeric:
-                                    years_exp = (max(years_numeric) - min(years_numeric)) / 10
-                                    if years_exp > 20:
-                                        years_exp = 20
-                            except:
-                                pass
-                    
-                    # Create summary
-                    words = text.split()[:120]
-                    summary = " ".join(words) + ("..." if len(text.split()) > 120 else "")
-                    
-                    # Categorize (simple version)
-                    categories = []
-                    if any(skill in ["python", "java", "javascript"] for skill in skills):
-                        categories.append("Developer")
-                    if any(skill in ["aws", "docker", "kubernetes", "cloud"] for skill in skills):
-                        categories.append("Cloud/DevOps")
-                    if any(skill in ["machine learning", "ai", "tensorflow", "pytorch"] for skill in skills):
-                        categories.append("Data Science")
-                    
-                    results.append({
-                        "filename": filename,
-                        "grade": grade,
-                        "skills": skills,
-                        "summary": summary,
-                        "word_count": len(text.split()),
-                        "years_experience": round(years_exp, 1),
-                        "categories": categories,
-                        "position_match": self.calculate_position_match(skills, target_position)
-                    })
+        with os.scandir(folder_path) as it:
+            entries = [e for e in it if e.is_file() and e.name.endswith(('.pdf', '.docx', '.txt'))]
+        
+        self._parse_in_parallel(entries)
         
+        # Per-file progress is buffered and written once after the loop
+        log_lines = []
+        for entry in entries:
+            file_path = entry.path
+            filename = entry.name
+            log_lines.append(f"  📄 Analyzing: {filename}")
+            
+            text = self.parse_resume_cached(file_path, entry.stat())
+            if text:
+                # Base features are position-independent; score every position from them
+                features = self._base_features(text)
+                grade, skills = self._apply_position(features, target_position)
+                position_scores = {
+                    position: self._apply_position(features, position)[0]
+                    for position in self.position_requirements
+                }
+                
+                # Summary, word count and years of experience
+                details = self._resume_details(text)
+                
+                # Categorize (simple version)
+                categories = []
+                if not _DEVELOPER_SKILLS.isdisjoint(skills):
+                    categories.append("Developer")
+                if not _DEVOPS_SKILLS.isdisjoint(skills):
+                    categories.append("Cloud/DevOps")
+                if not _ML_SKILLS.isdisjoint(skills):
+                    categories.append("Data Science")
+                
+                results.append({
+                    "filename": filename,
+                    "grade": grade,
+                    "skills": skills,
+                    "summary": details["summary"],
+                    "word_count": details["word_count"],
+                    "years_experience": details["years_experience"],
+                    "categories": categories,
+                    "position_match": self.calculate_position_match(skills, target_position),
+                    "position_scores": position_scores
+                })
+        
+        if log_lines:
+            sys.stdout.write("\n".join(log_lines) + "\n")
+        
+        # Entries for files no longer in this folder (or since modified) are dropped
+        self._prune_cache({_file_key(entry.path, entry.stat()) for entry in entries})
+        self.save_cache()
         return results
     
     def calculate_position_match(self, skills, target_position):
         """Calculate how well skills match target position (0-100%)"""
-        required_skills = self.position_requirements.get(target_position, [])
+        required_skills = self._required_sets.get(target_position)
         if not required_skills:
             return 0
         
-        matched = [skill for skill in skills if skill in required_skills]
-        match_percentage = (len(matched) / len(required_skills)) * 100
+        matched = sum(1 for skill in skills if skill in required_skills)
+        match_percentage = (matched / len(required_skills)) * 100
         return min(100, round(match_percentage))
     
     def create_realistic_sample_resumes(self):
@@ -430,22 +693,24 @@ class RealisticResumeScreener:
     def extract_experience(self, text):
         """Extract years of experience"""
         years_exp = 0
-        year_match = re.search(r'(\d+)\s+years?\s+experience', text.lower())
+        year_match = _STATED_YEARS_RE.search(text)
         if year_match:
             years_exp = int(year_match.group(1))
         else:
             # Try to estimate from dates
-            year_pattern = r'(?:19|20)\d{2}'
-            years = re.findall(year_pattern, text)
-            if len(years) >= 2:
-                try:
-                    years_numeric = [int(y) for y in years if 1900 <= int(y) <= 2024]
-                    if years_numeric:
-                        years_exp = (max(years_numeric) - min(years_numeric)) / 10
-                        if years_exp > 20:
-                            years_exp = 20
-                except:
-                    pass
+            # One pass: count year mentions and track the earliest/latest plausible one
+            mentions = 0
+            earliest = latest = None
+            for match in _YEAR_RE.finditer(text):
+                mentions += 1
+                year = int(match.group())
+                if 1900 <= year <= 2024:
+                    if earliest is None or year < earliest:
+                        earliest = year
+                    if latest is None or year > latest:
+                        latest = year
+            if mentions >= 2 and earliest is not None:
+                years_exp = min((latest - earliest) / 10, 20)
         return round(years_exp, 1)
 
     def run_screening(self, target_position="software_engineer"):
@@ -461,8 +726,8 @@ class RealisticResumeScreener:
             print("❌ No resumes found or processed")
             return
         
-        # Sort by grade
-        results.sort(key=lambda x: x["grade"], reverse=True)
+        # Rank candidates; the CSV/JSON files and the returned list keep this order
+        results.sort(key=itemgetter("grade"), reverse=True)
         
         # Display results
         print(f"\n✅ Processed {len(results)} resumes")
@@ -481,13 +746,14 @@ class RealisticResumeScreener:
             print(f"   Top Skills: {skills_str}")
         
         # Save to CSV
-        df = pd.DataFrame(results)
-        
         # Ensure results directory exists
         os.makedirs("./results", exist_ok=True)
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         csv_file = f"./results/realistic_results_{timestamp}.csv"
-        df.to_csv(csv_file, index=False, encoding='utf-8')
+        with open(csv_file, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=list(results[0].keys()))
+            writer.writeheader()
+            writer.writerows(results)
         
         # Save detailed JSON
         json_file = csv_file.replace('.csv', '.json')
@@ -537,3 +803,25 @@ class RealisticResumeScreener:
         print("="*60)
         
         return results
+
+
+# Screener used inside ProcessPoolExecutor workers (one per worker process)
+_worker_screener = None
+
+def _parse_and_extract(file_path):
+    """Worker: parse one resume and compute its base features"""
+    screener = _get_worker_screener()
+    text = screener.parse_resume(file_path)
+    features = screener._extract_features(text) if text else None
+    return text, features
+
+def _get_worker_screener():
+    global _worker_screener
+    if _worker_screener is None:
+        _worker_screener = RealisticResumeScreener(cache_file=None)
+    return _worker_screener
+
+def parse_resume_bytes(data, ext):
+    """Worker: parse an in-memory resume (e.g. a web upload) by extension"""
+    from io import BytesIO
+    return _get_worker_screener().parse_resume_stream(BytesIO(data), ext)
@@ -1,8 +1,16 @@
+import io
 import os
 import sys
 import argparse
+import logging
+import threading
 import time
 
+def _is_empty_dir(path):
+    """True if the directory has no entries (reads at most one)"""
+    with os.scandir(path) as it:
+        return next(it, None) is None
+
 def run_scan(args):
     """Run standard directory scan"""
     if args.llm:
@@ -15,7 +23,7 @@ def run_scan(args):
         screener = RealisticResumeScreener()
     
     # Handle sample creation if folder empty/not found
-    if not os.path.exists("./resumes") or not os.listdir("./resumes"):
+    if not os.path.exists("./resumes") or _is_empty_dir("./resumes"):
         print("Folder empty or not found. Creating samples...")
         if hasattr(screener, 'create_realistic_sample_resumes'):
              screener.create_realistic_sample_resumes()
@@ -40,21 +48,62 @@ def run_web_app(args):
     print("[WEB] Launching Web UI...")
     os.system("streamlit run web_app.py")
 
-def run_email_agent(args):
-    """Run Email Agent"""
+def _build_email_agent(position, use_llm=False, use_gpu=None, screener=None):
+    """Create an EmailAgent for the given position and screening mode"""
     from agents.email_agent.email_agent import EmailAgent
     
+    if screener is not None:
+        print(f"[EMAIL] Using provided {type(screener).__name__} (Position: {position})...")
+        return EmailAgent(screener=screener, target_position=position)
+    if use_llm:
+        print(f"[LLM] Using LLM Agents for Email Screening (Position: {position})...")
+        from core.llm_screener import LLMScreener
+        screener = LLMScreener(use_gpu=use_gpu)
+        return EmailAgent(screener=screener, target_position=position)
+    print(f"[RULE-BASED] Starting Email Screening (Position: {position})...")
+    return EmailAgent(target_position=position)
+
+# Loggers whose output screen_emails() captures; the root logger is left alone
+SCREEN_EMAILS_LOGGERS = ("agents.email_agent.email_agent", "core.llm_screener")
+
+def screen_emails(days=7, position="software_engineer", force_rescan=False,
+                  use_llm=False, use_gpu=None, screener=None):
+    """
+    Run one email screening cycle in the current process.
+    
+    Returns {"success": bool, "logs": str, "summary": dict} or, on failure,
+    {"success": False, "error": str, "logs": str}.
+    """
+    log_buffer = io.StringIO()
+    handler = logging.StreamHandler(log_buffer)
+    handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+    # Only keep records from this call's thread so concurrent sessions don't
+    # see each other's logs
+    thread_id = threading.get_ident()
+    handler.addFilter(lambda record: record.thread == thread_id)
+    loggers = [logging.getLogger(name) for name in SCREEN_EMAILS_LOGGERS]
+    previous_levels = [logger.level for logger in loggers]
+    for logger in loggers:
+        logger.addHandler(handler)
+        if logger.getEffectiveLevel() > logging.INFO:
+            logger.setLevel(logging.INFO)
+    try:
+        agent = _build_email_agent(position, use_llm=use_llm, use_gpu=use_gpu, screener=screener)
+        summary = agent.run_once(days_back=days, ignore_processed=force_rescan)
+        return {"success": True, "logs": log_buffer.getvalue(), "summary": summary}
+    except Exception as e:
+        return {"success": False, "error": str(e), "logs": log_buffer.getvalue()}
+    finally:
+        for logger, level in zip(loggers, previous_levels):
+            logger.removeHandler(handler)
+            logger.setLevel(level)
+
+def run_email_agent(args):
+    """Run Email Agent"""
     print("[EMAIL] Starting Email Agent...")
     print(f"   Mode: {'Continuous' if args.continuous else 'Run Once'}")
     
-    if args.llm:
-         print(f"[LLM] Using LLM Agents for Email Screening (Position: {args.position})...")
-         from core.llm_screener import LLMScreener
-         screener = LLMScreener(use_gpu=args.gpu)
-         agent = EmailAgent(screener=screener, target_position=args.position)
-    else:
-         print(f"[RULE-BASED] Starting Email Screening (Position: {args.position})...")
-         agent = EmailAgent(target_position=args.position)
+    agent = _build_email_agent(args.position, use_llm=args.llm, use_gpu=args.gpu)
     
     if args.continuous:
         agent.run_continuously(interval_minutes=args.interval)
@@ -0,0 +1,163 @@
+import io
+import re
+import unittest
+import zipfile
+
+from core.screener import RealisticResumeScreener, summarize_words, trie_regex
+
+CONTENT_TYPES = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">
+<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>
+<Default Extension="xml" ContentType="application/xml"/>
+<Override PartName="/word/document.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>
+</Types>"""
+
+RELS = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
+<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="word/document.xml"/>
+</Relationships>"""
+
+# Body paragraph with split runs and a tab stop definition, a table, and a
+# text box stored the way Word saves it (mc:Choice plus a VML mc:Fallback copy)
+DOCUMENT = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+  xmlns:mc="http://schemas.openxmlformats.org/markup-compatibility/2006"
+  xmlns:wp="http://schemas.openxmlformats.org/drawingml/2006/wordprocessingDrawing"
+  xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main"
+  xmlns:wps="http://schemas.microsoft.com/office/word/2010/wordprocessingShape"
+  xmlns:v="urn:schemas-microsoft-com:vml"
+  mc:Ignorable="wps">
+<w:body>
+<w:p><w:pPr><w:tabs><w:tab w:val="left" w:pos="720"/></w:tabs></w:pPr>
+  <w:r><w:t>Main</w:t></w:r><w:r><w:t xml:space="preserve"> text &amp; more</w:t><w:tab/><w:t>Docker</w:t></w:r></w:p>
+<w:p/>
+<w:tbl><w:tr><w:tc><w:p><w:r><w:t>Kubernetes</w:t></w:r></w:p></w:tc></w:tr></w:tbl>
+<w:p><w:r>
+  <mc:AlternateContent>
+    <mc:Choice Requires="wps"><w:drawing><wp:anchor><a:graphic><a:graphicData>
+      <wps:wsp><wps:txbx><w:txbxContent>
+        <w:p><w:r><w:t>Sidebar Python AWS</w:t></w:r></w:p>
+      </w:txbxContent></wps:txbx></wps:wsp>
+    </a:graphicData></a:graphic></wp:anchor></w:drawing></mc:Choice>
+    <mc:Fallback><w:pict><v:shape><v:textbox><w:txbxContent>
+      <w:p><w:r><w:t>Sidebar Python AWS</w:t></w:r></w:p>
+    </w:txbxContent></v:textbox></v:shape></w:pict></mc:Fallback>
+  </mc:AlternateContent>
+</w:r></w:p>
+<w:sectPr/>
+</w:body>
+</w:document>"""
+
+
+def make_docx():
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, 'w', zipfile.ZIP_DEFLATED) as docx:
+        docx.writestr('[Content_Types].xml', CONTENT_TYPES)
+        docx.writestr('_rels/.rels', RELS)
+        docx.writestr('word/document.xml', DOCUMENT)
+    buf.seek(0)
+    return buf
+
+
+class ReadDocxTest(unittest.TestCase):
+    def setUp(self):
+        self.screener = RealisticResumeScreener(cache_file=None)
+
+    def test_paragraphs_tables_and_text_box(self):
+        text = self.screener._read_docx(make_docx())
+        self.assertEqual(text, "Main text & more\tDocker\nKubernetes\nSidebar Python AWS")
+
+    def test_text_box_fallback_copy_is_skipped(self):
+        text = self.screener.parse_resume_stream(make_docx(), '.docx')
+        self.assertEqual(text.count("Sidebar Python AWS"), 1)
+
+
+# Words where one is a prefix of another, plus punctuation that needs escaping
+PREFIX_WORDS = ["java", "javascript", "c", "c++", "c#", "go", "golang", "node", "node.js",
+                "machine learning", "machine", "sql", "nosql", "r", "react", "react native"]
+
+PREFIX_TEXT = ("Java and JavaScript, C, C++ and C# with Golang/Go. Node.js or node; "
+               "Machine Learning, machine vision, NoSQL and SQL, R, React Native, React.js, "
+               "javascripts c+ C#.NET nodejs")
+
+
+def sorted_alternation(words):
+    return '|'.join(re.escape(w) for w in sorted(words, key=len, reverse=True))
+
+
+class TrieRegexTest(unittest.TestCase):
+    def assertSameMatches(self, pattern, expected_pattern, text):
+        self.assertEqual(
+            [m.span() for m in re.finditer(pattern, text, re.IGNORECASE)],
+            [m.span() for m in re.finditer(expected_pattern, text, re.IGNORECASE)],
+        )
+
+    def test_matches_sorted_alternation_with_word_boundaries(self):
+        self.assertSameMatches(
+            r'\b(' + trie_regex(PREFIX_WORDS) + r')\b',
+            r'\b(' + sorted_alternation(PREFIX_WORDS) + r')\b',
+            PREFIX_TEXT,
+        )
+
+    def test_matches_sorted_alternation_without_boundaries(self):
+        self.assertSameMatches(trie_regex(PREFIX_WORDS), sorted_alternation(PREFIX_WORDS), PREFIX_TEXT)
+
+    def test_mixed_case_words(self):
+        words = ["Java", "JavaScript", "AWS", "aws lambda"]
+        self.assertSameMatches(trie_regex(words), sorted_alternation(words),
+                               "JAVASCRIPT java AWS Lambda aws")
+
+    def test_screener_skill_pattern(self):
+        screener = RealisticResumeScreener(cache_file=None)
+        self.assertSameMatches(
+            screener._skills_re.pattern,
+            r'\b(' + sorted_alternation(screener.skill_weights) + r')\b',
+            PREFIX_TEXT + " Docker, Kubernetes, AWS and Azure with TensorFlow",
+        )
+
+
+class SummarizeWordsTest(unittest.TestCase):
+    LIMIT = 5
+
+    def assertMatchesSplit(self, text):
+        words = text.split()
+        expected = " ".join(words[:self.LIMIT]) + ("..." if len(words) > self.LIMIT else "")
+        self.assertEqual(summarize_words(text, self.LIMIT), (expected, len(words)))
+
+    def test_limit_boundary(self):
+        for count in (0, 1, self.LIMIT - 1, self.LIMIT, self.LIMIT + 1, self.LIMIT * 3):
+            with self.subTest(count=count):
+                self.assertMatchesSplit(" ".join(f"word{i}" for i in range(count)))
+
+    def test_irregular_whitespace(self):
+        for count in (self.LIMIT - 1, self.LIMIT, self.LIMIT + 1):
+            with self.subTest(count=count):
+                self.assertMatchesSplit("  \n\t".join(f"w{i}" for i in range(count)) + " \n ")
+
+
+class DegreeScoreTest(unittest.TestCase):
+    def setUp(self):
+        self.screener = RealisticResumeScreener(cache_file=None)
+
+    def education_points(self, text):
+        return (self.screener.grade_resume(text, "software_engineer")[0]
+                - self.screener.grade_resume("Resume", "software_engineer")[0])
+
+    def test_degree_abbreviations(self):
+        cases = {
+            "BSc Computer Science": 7, "B.Sc in Physics": 7, "B.S. in CS": 7, "BS Math": 7,
+            "B.Tech IT": 7, "Bachelor's degree": 7, "MSc Data Science": 10, "M.S. in CS": 10,
+            "Masters in CS": 10, "PhD in ML": 15,
+        }
+        for text, points in cases.items():
+            with self.subTest(text=text):
+                self.assertEqual(self.education_points(text), points)
+
+    def test_abbreviations_inside_words_are_ignored(self):
+        for text in ("Jobs and systems", "Absent", "Items shipped"):
+            with self.subTest(text=text):
+                self.assertEqual(self.education_points(text), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
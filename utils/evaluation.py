@@ -1,6 +1,5 @@
 import json
-import numpy as np
-from sklearn.metrics import f1_score, precision_score, recall_score
+import math
 from typing import Dict, List, Tuple
 
 class Evaluator:
@@ -9,11 +8,14 @@ class Evaluator:
     @staticmethod
     def calculate_f1(predictions: List[str], truths: List[str]) -> Dict:
         """Calculate F1 score for classification"""
-        unique_labels = list(set(predictions + truths))
+        from sklearn.metrics import precision_recall_fscore_support
         
-        precision = precision_score(truths, predictions, average='weighted', zero_division=0)
-        recall = recall_score(truths, predictions, average='weighted', zero_division=0)
-        f1 = f1_score(truths, predictions, average='weighted', zero_division=0)
+        unique_labels = list({*predictions, *truths})
+        
+        # One call computes the confusion counts once for all three metrics
+        precision, recall, f1, _ = precision_recall_fscore_support(
+            truths, predictions, average='weighted', zero_division=0
+        )
         
         return {
             "f1_score": f1,
@@ -28,23 +30,28 @@ class Evaluator:
         if len(predicted_grades) != len(true_grades):
             raise ValueError("Grade lists must have same length")
         
+        # Single pass: accumulate sum and sum of squares instead of storing differences
         correct = 0
-        differences = []
+        diff_sum = 0
+        diff_sq_sum = 0
         
         for pred, true in zip(predicted_grades, true_grades):
             diff = abs(pred - true)
-            differences.append(diff)
+            diff_sum += diff
+            diff_sq_sum += diff * diff
             if diff <= tolerance:
                 correct += 1
         
-        accuracy = correct / len(predicted_grades)
+        n = len(predicted_grades)
+        accuracy = correct / n
+        mean = diff_sum / n
         
         return {
             "accuracy": accuracy,
             "correct_count": correct,
-            "total_count": len(predicted_grades),
-            "mean_difference": np.mean(differences),
-            "std_difference": np.std(differences)
+            "total_count": n,
+            "mean_difference": mean,
+            "std_difference": math.sqrt(max(diff_sq_sum / n - mean * mean, 0.0))
         }
     
     @staticmethod
@@ -54,10 +61,10 @@ class Evaluator:
         manual_top = manual_results.get("top_candidates", [])[:10]
         auto_top = auto_results.get("top_candidates", [])[:10]
         
-        manual_ids = [c["id"] for c in manual_top]
-        auto_ids = [c["id"] for c in auto_top]
+        manual_ids = {c["id"] for c in manual_top}
+        auto_ids = {c["id"] for c in auto_top}
         
-        overlap = set(manual_ids) & set(auto_ids)
+        overlap = manual_ids & auto_ids
         
         return {
             "manual_count": len(manual_top),
@@ -0,0 +1,30 @@
+def extract_pdf_text(source):
+    """
+    Extract PDF text from a path or binary file object, skipping empty pages.
+    
+    Uses PyMuPDF (much faster for plain text) and falls back to pdfplumber when
+    it is not installed or cannot read the file (corrupt/encrypted PDFs).
+    """
+    try:
+        import pymupdf
+    except ImportError:
+        try:
+            import fitz as pymupdf  # PyMuPDF releases without the pymupdf module name
+        except ImportError:
+            pymupdf = None
+    
+    if pymupdf is not None:
+        try:
+            if isinstance(source, str):
+                doc = pymupdf.open(source)
+            else:
+                doc = pymupdf.open(stream=source.read(), filetype="pdf")
+            with doc:
+                return "\n".join(t for page in doc if (t := page.get_text("text")))
+        except Exception:
+            if not isinstance(source, str):
+                source.seek(0)
+    
+    import pdfplumber
+    with pdfplumber.open(source) as pdf:
+        return "\n".join(t for page in pdf.pages if (t := page.extract_text()))
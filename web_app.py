@@ -4,30 +4,38 @@ Run with: streamlit run web_app.py
 """
 
 import streamlit as st
-import pandas as pd
 import os
 import json
-import re
+import glob
+import hashlib
+import time
+from collections import Counter
+from itertools import chain
+from operator import itemgetter
 from datetime import datetime
-import plotly.express as px
-import plotly.graph_objects as go
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
 from io import BytesIO
 
-# Import core screener
-# Import core screeners
+# orjson is optional; it is only used to speed up JSON (de)serialization
 try:
-    from core.screener import RealisticResumeScreener
-    from core.llm_screener import LLMScreener
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+    orjson = None
+
+# Import core screener (LLMScreener is imported on first use, see load_llm_screener)
+try:
+    from core.screener import (RealisticResumeScreener, summarize_words, parse_resume_bytes,
+                               CACHE_VERSION, DEGREE_RE)
 except ImportError:
     # If run from root, this works. If run from inside, might need path adjustment
     import sys
     sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-    from core.screener import RealisticResumeScreener
-    # LLMScreener might fail if agents missing dependencies, handle gracefully
-    try:
-        from core.llm_screener import LLMScreener
-    except:
-        LLMScreener = None
+    from core.screener import (RealisticResumeScreener, summarize_words, parse_resume_bytes,
+                               CACHE_VERSION, DEGREE_RE)
 
 # Page configuration
 st.set_page_config(
@@ -76,32 +84,75 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+# Education label per DEGREE_RE group (the grader's pattern, so label and score agree)
+EDU_LEVELS = {"phd": ("PhD", 3), "ms": ("Master's", 2), "bs": ("Bachelor's", 1)}
+
+_DIRS_READY = False
+
+def _ensure_dirs():
+    """Create the upload/result directories once per process"""
+    global _DIRS_READY
+    if not _DIRS_READY:
+        os.makedirs("./uploads", exist_ok=True)
+        os.makedirs("./results", exist_ok=True)
+        _DIRS_READY = True
+
+@st.cache_resource(show_spinner=False)
+def get_parse_pool():
+    """Worker processes for CPU-bound PDF/DOCX parsing, shared by all sessions"""
+    # spawn: workers import core.screener only, not this Streamlit script
+    return ProcessPoolExecutor(max_workers=os.cpu_count() or 1,
+                               mp_context=multiprocessing.get_context("spawn"))
+
+@st.cache_resource(show_spinner=False)
+def load_llm_screener():
+    """LLMScreener class, imported on first use (it pulls in torch and the agents); None if unavailable"""
+    # LLMScreener might fail if agents missing dependencies, handle gracefully
+    try:
+        from core.llm_screener import LLMScreener
+        return LLMScreener
+    except Exception:
+        return None
+
+@st.cache_resource(show_spinner=False)
+def get_screener(mode):
+    """One screener instance per mode for the whole process (models load once)"""
+    llm_screener_cls = load_llm_screener() if mode == "llm" else None
+    if llm_screener_cls:
+        return llm_screener_cls()
+    # No CLI cache file: analyses are cached (bounded) by analyze_text
+    return RealisticResumeScreener(cache_file=None)
+
 class ResumeScreenerWebWrapper:
     def __init__(self, mode="rule_based"):
         self.mode = mode
-        if mode == "llm" and LLMScreener:
-            self.screener = LLMScreener()
+        self.screener = get_screener(mode)
+        # Uploads are parsed in memory by the rule-based parser in either mode
+        if hasattr(self.screener, "parse_resume_stream"):
+            self.parser = self.screener
         else:
-            self.screener = RealisticResumeScreener()
-        # Create necessary directories
-        os.makedirs("./uploads", exist_ok=True)
-        os.makedirs("./results", exist_ok=True)
+            self.parser = get_screener("rule_based")
+        _ensure_dirs()
     
-    def parse_resume(self, file_bytes, filename):
-        """Parse uploaded resume file"""
-        # Save temporarily to parse
-        temp_path = os.path.join("./uploads", filename)
-        with open(temp_path, "wb") as f:
-            f.write(file_bytes)
-        
-        text = self.screener.parse_resume(temp_path)
-        
-        # Clean up
-        try:
-            os.remove(temp_path)
-        except:
-            pass
-            
+    def parse_resume(self, source, filename):
+        """Parse uploaded resume file (raw bytes or a binary file object)"""
+        ext = os.path.splitext(filename)[1].lower()
+        if ext in ('.pdf', '.docx'):
+            # CPU-bound and GIL-held: parse in a worker process so uploads run in parallel.
+            # This costs a copy of the file (plus pickling it to the worker), traded for parallelism.
+            data = source if isinstance(source, (bytes, bytearray)) else source.getvalue()
+            try:
+                text = get_parse_pool().submit(parse_resume_bytes, data, ext).result()
+            except BrokenProcessPool:
+                # A worker died (crash on a malformed file, OOM kill): replace the
+                # shared pool for later uploads and parse this one here instead
+                get_parse_pool.clear()
+                text = self.parser.parse_resume_stream(BytesIO(data), ext)
+            except Exception:
+                text = self.parser.parse_resume_stream(BytesIO(data), ext)
+        else:
+            fp = BytesIO(source) if isinstance(source, (bytes, bytearray)) else source
+            text = self.parser.parse_resume_stream(fp, ext)
         return text if text else "Could not read file"
     
     def analyze_resume(self, text, position):
@@ -115,19 +166,22 @@ class ResumeScreenerWebWrapper:
         # Extract experience
         experience = self.screener.extract_experience(text)
         
-        # Determine education level (simple extraction)
-        text_lower = text.lower()
+        # Determine education level (highest degree mentioned)
         education = "Not specified"
-        if "phd" in text_lower or "doctorate" in text_lower:
-            education = "PhD"
-        elif "master" in text_lower or "ms" in text_lower:
-            education = "Master's"
-        elif "bachelor" in text_lower or "bs" in text_lower:
-            education = "Bachelor's"
+        best_rank = 0
+        for match in DEGREE_RE.finditer(text):
+            if match.lastgroup not in EDU_LEVELS:
+                continue  # a bare "education" heading scores points but names no degree
+            label, rank = EDU_LEVELS[match.lastgroup]
+            if rank > best_rank:
+                education, best_rank = label, rank
+                if match.lastgroup == "phd":
+                    break
             
-        # Create summary
-        words = text.split()
-        summary = " ".join(words[:150]) + "..." if len(words) > 150 else text
+        # Create summary (short resumes are shown as-is)
+        summary, word_count = summarize_words(text, 150)
+        if word_count <= 150:
+            summary = text
         
         return {
             "score": grade,
@@ -135,35 +189,342 @@ class ResumeScreenerWebWrapper:
             "experience_years": experience,
             "education_level": education,
             "summary": summary,
-            "word_count": len(words),
+            "word_count": word_count,
             "skills_match": self.screener.calculate_position_match(skills, position)
         }
     
     def run_email_agent_process(self, days=7, position="software_engineer", force_rescan=False):
-        """Run the email agent as a subprocess"""
-        import subprocess
-        try:
-            # Command to run
-            cmd = ["python", "main.py", "email", "--llm", "--days", str(days), "--position", position]
-            if force_rescan:
-                cmd.append("--force-rescan")
-            
-            # Run command
-            process = subprocess.run(
-                cmd, 
-                capture_output=True, 
-                text=True,
-                check=False
-            )
-            
-            return {
-                "success": process.returncode == 0,
-                "stdout": process.stdout,
-                "stderr": process.stderr,
-                "returncode": process.returncode
-            }
-        except Exception as e:
-            return {"success": False, "error": str(e)}
+        """Run one email agent cycle in this process (LLM agents, as before)"""
+        from main import screen_emails
+        # Reuse the already-loaded LLM screener instead of building a new one
+        screener = self.screener if self.mode == "llm" else None
+        return screen_emails(days=days, position=position, force_rescan=force_rescan,
+                             use_llm=True, use_gpu=False, screener=screener)
+
+@st.cache_resource(show_spinner=False)
+def get_wrapper(mode):
+    """One wrapper per screening mode, shared across reruns and sessions"""
+    return ResumeScreenerWebWrapper(mode=mode)
+
+# Parsed text and analyses for uploads, persisted across app restarts
+# Entries hold the full text of uploaded resumes (candidate PII), so they are
+# kept for at most UPLOAD_CACHE_MAX_AGE seconds; expired ones are deleted on
+# the next cache write (checked at most once per UPLOAD_CACHE_PRUNE_INTERVAL).
+# Entries are tagged with the screener's CACHE_VERSION; ones written by older
+# extraction or scoring code are ignored and overwritten.
+UPLOAD_CACHE_DIR = "./uploads/cache"
+UPLOAD_CACHE_MAX_AGE = 7 * 24 * 3600
+UPLOAD_CACHE_PRUNE_INTERVAL = 3600
+_last_upload_cache_prune = 0.0
+
+def content_hash(data):
+    """Short content hash used as a cache key"""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+def _read_upload_cache(key):
+    try:
+        with open(os.path.join(UPLOAD_CACHE_DIR, f"{key}.json"), 'r', encoding='utf-8') as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(entry, dict) or entry.get("version") != CACHE_VERSION:
+        return {}
+    return entry
+
+def prune_upload_cache(max_age=UPLOAD_CACHE_MAX_AGE):
+    """Delete upload cache entries written more than max_age seconds ago"""
+    cutoff = time.time() - max_age
+    try:
+        with os.scandir(UPLOAD_CACHE_DIR) as it:
+            for entry in it:
+                if entry.name.endswith('.json') and entry.stat().st_mtime < cutoff:
+                    try:
+                        os.remove(entry.path)
+                    except OSError:
+                        pass
+    except OSError:
+        pass
+
+def _write_upload_cache(key, entry):
+    global _last_upload_cache_prune
+    now = time.time()
+    if now - _last_upload_cache_prune > UPLOAD_CACHE_PRUNE_INTERVAL:
+        _last_upload_cache_prune = now
+        prune_upload_cache()
+    try:
+        os.makedirs(UPLOAD_CACHE_DIR, exist_ok=True)
+        with open(os.path.join(UPLOAD_CACHE_DIR, f"{key}.json"), 'w', encoding='utf-8') as f:
+            json.dump({**entry, "version": CACHE_VERSION}, f, ensure_ascii=False)
+    except OSError:
+        pass
+
+def upload_key(upload):
+    """Content hash of an uploaded file, read in place without copying it"""
+    with upload.getbuffer() as view:
+        return content_hash(view)
+
+@st.cache_data(show_spinner=False, max_entries=512)
+def parse_upload(_wrapper, key, _upload, filename):
+    """Parse an uploaded file once per unique content (memory, then disk)"""
+    entry = _read_upload_cache(key)
+    if "text" in entry:
+        return entry["text"]
+    
+    _upload.seek(0)
+    text = _wrapper.parse_resume(_upload, filename)
+    if text != "Could not read file":
+        _write_upload_cache(key, {"text": text})
+    return text
+
+@st.cache_data(show_spinner=False, max_entries=512)
+def analyze_text(_wrapper, mode, text_hash, _text, position):
+    """Analyze resume text once per (mode, text hash, position)"""
+    # Analyses live in their own cache file, keyed by the text hash
+    entry = _read_upload_cache(text_hash)
+    analysis_key = f"{mode}:{position}"
+    if analysis_key in entry.get("analysis", {}):
+        return entry["analysis"][analysis_key]
+    
+    analysis = _wrapper.analyze_resume(_text, position)
+    if "error" not in analysis:
+        entry.setdefault("analysis", {})[analysis_key] = analysis
+        _write_upload_cache(text_hash, entry)
+    return analysis
+
+def process_upload(wrapper, key, upload, filename, position):
+    """Parse and analyze one uploaded file (safe to run in a worker thread)"""
+    # Parse and analyze (memoized by content hash across reruns)
+    text = parse_upload(wrapper, key, upload, filename)
+    analysis = analyze_text(wrapper, wrapper.mode, content_hash(text.encode('utf-8')), text, position)
+    
+    # Add filename and text preview
+    analysis["filename"] = filename
+    analysis["text_preview"] = text[:500] + "..." if len(text) > 500 else text
+    return analysis
+
+def upload_batch_hash(uploads):
+    """Hash of an upload batch: file names and content keys, in upload order"""
+    h = hashlib.blake2b(digest_size=16)
+    for key, _, filename in uploads:
+        h.update(filename.encode('utf-8'))
+        h.update(key.encode('ascii'))
+    return h.hexdigest()
+
+def screen_uploads(wrapper, uploads, position, on_progress=None):
+    """Parse and analyze an upload batch in worker threads (each file is cached on its own)"""
+    all_results = [None] * len(uploads)
+    # The LLM screener shares one model pipeline/API client that is not safe to call
+    # concurrently, so LLM grading runs one file at a time
+    max_workers = 1 if wrapper.mode == "llm" else min(8, len(uploads))
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(process_upload, wrapper, key, upload, filename, position): i
+            for i, (key, upload, filename) in enumerate(uploads)
+        }
+        # Report progress from the script thread as files finish
+        for done, future in enumerate(as_completed(futures), 1):
+            i = futures[future]
+            all_results[i] = future.result()
+            if on_progress:
+                on_progress(done, uploads[i][2])
+    return all_results
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def results_frame(mode, batch_hash, position, _results):
+    """Results of a screened batch as a DataFrame sorted by score, built once per batch"""
+    import pandas as pd
+    
+    all_results = list(_results)
+    # Sort the rows before building the frame (stable, so ties keep upload order)
+    all_results.sort(key=itemgetter("score"), reverse=True)
+    df = pd.DataFrame(all_results)
+    
+    # Smallest integer dtype that fits (scores and match % fit int8); non-integral columns stay float
+    for column in ("score", "skills_match", "word_count"):
+        if column in df:
+            df[column] = pd.to_numeric(df[column], downcast="integer")
+    return df
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def export_results(mode, batch_hash, position, _df):
+    """CSV and JSON download bytes, serialized once per screened batch"""
+    csv_bytes = _df.to_csv(index=False).encode('utf-8')
+    if HAS_ORJSON:
+        json_bytes = orjson.dumps(_df.to_dict('records'),
+                                  option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+    else:
+        json_bytes = _df.to_json(orient='records', indent=2).encode('utf-8')
+    return csv_bytes, json_bytes
+
+@st.cache_data(show_spinner=False)
+def make_score_overview(scores, experience, skills_match, filenames):
+    """Score distribution and score vs experience side by side, as one figure dict"""
+    import pandas as pd
+    import plotly.express as px
+    from plotly.subplots import make_subplots
+    
+    frame = pd.DataFrame({"score": scores, "experience_years": experience,
+                          "skills_match": skills_match, "filename": filenames})
+    histogram = px.histogram(frame, x="score", nbins=20)
+    scatter = px.scatter(frame, x="experience_years", y="score",
+                         size="skills_match", hover_data=["filename"],
+                         labels={"experience_years": "Years of Experience",
+                                 "score": "Score", "skills_match": "Skills Match %"})
+    
+    fig = make_subplots(rows=1, cols=2, subplot_titles=(
+        "Score Distribution Across Candidates",
+        "Score vs Experience (bubble size = skills match %)"
+    ))
+    fig.add_traces(histogram.data, rows=1, cols=1)
+    fig.add_traces(scatter.data, rows=1, cols=2)
+    fig.update_xaxes(title_text="Score", row=1, col=1)
+    fig.update_yaxes(title_text="Number of Candidates", row=1, col=1)
+    fig.update_xaxes(title_text="Years of Experience", row=1, col=2)
+    fig.update_yaxes(title_text="Score", row=1, col=2)
+    fig.update_layout(bargap=0.1, showlegend=False)
+    return fig.to_dict()
+
+def candidate_card_html(row):
+    """HTML card for one candidate in the top candidates list"""
+    return f"""<div class="candidate-card">
+    <h4>{row['filename']} - <span style="color: #3B82F6;">{row['score']}/100</span></h4>
+    <p><strong>Experience:</strong> {row['experience_years']} years | 
+    <strong>Education:</strong> {row['education_level']} | 
+    <strong>Skills Match:</strong> {row['skills_match']}%</p>
+    <p><strong>Top Skills:</strong> {', '.join(row['skills'][:5])}</p>
+    <details>
+        <summary>View Summary</summary>
+        <p>{row['summary']}</p>
+    </details>
+</div>"""
+
+# Score gauge layout; only the value differs between candidates
+GAUGE_TEMPLATE = {
+    "mode": "gauge+number",
+    "title": {'text': "Score"},
+    "domain": {'x': [0, 1], 'y': [0, 1]},
+    "gauge": {
+        'axis': {'range': [0, 100]},
+        'bar': {'color': "#3B82F6"},
+        'steps': [
+            {'range': [0, 60], 'color': "lightgray"},
+            {'range': [60, 80], 'color': "lightblue"},
+            {'range': [80, 100], 'color': "lightgreen"}
+        ]
+    }
+}
+
+@st.cache_data(show_spinner=False)
+def make_candidate_figure(score, skills, weights):
+    """Score gauge and skill weight bars for one candidate, as one figure dict"""
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
+    
+    if not skills:
+        return go.Figure(go.Indicator(value=score, **GAUGE_TEMPLATE)).to_dict()
+    
+    fig = make_subplots(rows=1, cols=2, specs=[[{"type": "indicator"}, {"type": "xy"}]],
+                        subplot_titles=("", "Skill Weights"))
+    fig.add_trace(go.Indicator(value=score, **GAUGE_TEMPLATE), row=1, col=1)
+    fig.add_trace(go.Bar(x=list(skills), y=list(weights)), row=1, col=2)
+    fig.update_xaxes(title_text="skill", row=1, col=2)
+    fig.update_yaxes(title_text="weight", row=1, col=2)
+    fig.update_layout(showlegend=False)
+    return fig.to_dict()
+
+def _load_json_file(path):
+    """Read a JSON file, with orjson when it is installed"""
+    if HAS_ORJSON:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r') as f:
+        return json.load(f)
+
+def email_results_signatures():
+    """(path, mtime, size) for every email results file; changes whenever a file does"""
+    paths = sorted(glob.glob(os.path.join("./email_results", "*.json")))
+    return tuple((p, os.path.getmtime(p), os.path.getsize(p)) for p in paths)
+
+@st.cache_data(ttl=60, show_spinner=False)
+def load_email_results(signatures):
+    """Load all email screening results, deduplicated and newest first"""
+    unique_results = {}
+    for path, _, _ in signatures:
+        data = _load_json_file(path)
+        for r in data.get("results") or []:
+            # Add date from file if not in result
+            if "screening_date" not in r:
+                r["screening_date"] = data.get("screening_date")
+            # Use email + position as key if candidate_id missing
+            key = r.get("candidate_id", f"{r['email_data']['from']}_{r['resume_info']['target_position']}")
+            # Files are read oldest first, so later duplicates win
+            unique_results[key] = r
+    
+    final_results = list(unique_results.values())
+    
+    # Sort by date
+    final_results.sort(key=lambda x: x.get("screening_results", {}).get("screened_date", ""), reverse=True)
+    return final_results
+
+# Flattened email result fields shown in the history table
+EMAIL_HISTORY_COLUMNS = {
+    "email_data.sender_name": "Name",
+    "email_data.from": "Email",
+    "email_data.subject": "Subject",
+    "resume_info.target_position": "Position",
+    "screening_results.score": "Score",
+    "screening_results.status": "Status",
+    "screening_results.experience_years": "Exp (Yrs)",
+    "screening_results.screened_date": "Date",
+}
+
+@st.fragment
+def render_recent_activity(recent_results):
+    """Recent email activity toggle; reruns on its own, without reloading results"""
+    if st.checkbox("Show Recent Email Activity", value=True):
+        for r in recent_results:
+            status_icon = "✅" if r["screening_results"]["status"] == "Accepted" else "❌" if r["screening_results"]["status"] == "Rejected" else "⚠️"
+            st.markdown(f"""
+            **{status_icon} {r['email_data']['sender_name']}**  
+            {r['resume_info']['target_position']} | Score: {r['screening_results']['score']}
+            """)
+
+@st.fragment
+def render_email_filters(df_email, position):
+    """Email history filters; widget changes rerun only this fragment"""
+    # Filter Section
+    st.subheader("🔍 Filter Candidates")
+    
+    col_f1, col_f2 = st.columns(2)
+    with col_f1:
+        status_filter = st.multiselect(
+            "Filter by Status",
+            ["Accepted", "Rejected", "Needs Review"],
+            default=["Accepted", "Needs Review"]
+        )
+    
+    # Default filter by selected position
+    default_pos_filter = [position]
+    if position not in df_email["Position"].unique():
+        default_pos_filter = []
+    
+    with col_f2:
+        pos_filter = st.multiselect(
+            "Filter by Position",
+            df_email["Position"].unique(),
+            default=[p for p in default_pos_filter if p in df_email["Position"].unique()]
+        )
+    
+    # Apply filters
+    df_filtered = df_email.copy()
+    if status_filter:
+        df_filtered = df_filtered[df_filtered["Status"].isin(status_filter)]
+    if pos_filter:
+        df_filtered = df_filtered[df_filtered["Position"].isin(pos_filter)]
+    
+    st.write(f"Showing {len(df_filtered)} filtered candidates:")
+    st.dataframe(df_filtered, width="stretch")
 
 # Sidebar
 with st.sidebar:
@@ -175,7 +536,7 @@ with st.sidebar:
     mode = st.radio("Screening Mode", ["Rule-Based (Fast)", "LLM Agent (Research)"])
     use_llm = "LLM" in mode
     
-    if use_llm and not LLMScreener:
+    if use_llm and not load_llm_screener():
         st.error("LLM Agents not available. Missing dependencies?")
         use_llm = False
 
@@ -189,7 +550,7 @@ with st.sidebar:
     
     st.markdown("---")
 
-    wrapper = ResumeScreenerWebWrapper(mode="llm" if use_llm else "rule_based")
+    wrapper = get_wrapper("llm" if use_llm else "rule_based")
     st.markdown("---")
 
     # Email Agent Section
@@ -218,66 +579,33 @@ with st.sidebar:
             if result.get("success"):
                 st.success("Email Agent finished successfully!")
                 with st.expander("View Logs"):
-                    st.code(result.get("stdout"))
+                    st.code(result.get("logs"))
             else:
                 st.error("Email Agent failed!")
                 if result.get("error"):
                     st.error(result["error"])
                 with st.expander("Error Details"):
-                    st.code(result.get("stderr"))
-                    st.code(result.get("stdout"))
+                    st.code(result.get("logs"))
     
     # Display Results (Aggregated)
-    import glob
     try:
-        results_files = glob.glob(os.path.join("./email_results", "*.json"))
-        if results_files:
-            all_results = []
-            
-            # Load all files
-            for file in results_files:
-                with open(file, 'r') as f:
-                    data = json.load(f)
-                    if data.get("results"):
-                        for r in data["results"]:
-                            # Add date from file if not in result
-                            if "screening_date" not in r:
-                                r["screening_date"] = data.get("screening_date")
-                            all_results.append(r)
-            
-            # Deduplicate by Candidate ID
-            unique_results = {}
-            for r in all_results:
-                # Use email + position as key if candidate_id missing
-                key = r.get("candidate_id", f"{r['email_data']['from']}_{r['resume_info']['target_position']}")
-                # Updating ensures we get the latest version if duplicates exist
-                unique_results[key] = r
-            
-            final_results = list(unique_results.values())
-            
-            # Sort by date
-            final_results.sort(key=lambda x: x.get("screening_results", {}).get("screened_date", ""), reverse=True)
+        final_results = load_email_results(email_results_signatures())
+        
+        if final_results:
+            st.divider()
+            st.markdown(f"### 📊 Email Stats (All Time)")
             
-            if final_results:
-                st.divider()
-                st.markdown(f"### 📊 Email Stats (All Time)")
-                
-                col_a, col_b = st.columns(2)
-                with col_a:
-                    st.metric("Total Candidates", len(final_results))
-                    st.metric("Accepted", len([r for r in final_results if r["screening_results"]["status"] == "Accepted"]))
-                    
-                with col_b:
-                    st.metric("Rejected", len([r for r in final_results if r["screening_results"]["status"] == "Rejected"]))
-                    st.metric("Needs Review", len([r for r in final_results if r["screening_results"]["status"] == "Needs Review"]))
+            status_counts = Counter(r["screening_results"]["status"] for r in final_results)
+            col_a, col_b = st.columns(2)
+            with col_a:
+                st.metric("Total Candidates", len(final_results))
+                st.metric("Accepted", status_counts["Accepted"])
                 
-                if st.checkbox("Show Recent Email Activity", value=True):
-                    for r in final_results[:5]:
-                        status_icon = "✅" if r["screening_results"]["status"] == "Accepted" else "❌" if r["screening_results"]["status"] == "Rejected" else "⚠️"
-                        st.markdown(f"""
-                        **{status_icon} {r['email_data']['sender_name']}**  
-                        {r['resume_info']['target_position']} | Score: {r['screening_results']['score']}
-                        """)
+            with col_b:
+                st.metric("Rejected", status_counts["Rejected"])
+                st.metric("Needs Review", status_counts["Needs Review"])
+            
+            render_recent_activity(final_results[:5])
     except Exception as e:
         st.error(f"Error loading results: {e}")
     
@@ -331,41 +659,40 @@ with col2:
 
 # Process files
 if uploaded_files:
-    st.markdown(f"## 📋 Processing {len(uploaded_files)} Resume(s)")
+    # Charting and DataFrame libraries are only needed once there are results
+    import pandas as pd
+    import plotly.express as px
+    import plotly.graph_objects as go
     
-    all_results = []
+    st.markdown(f"## 📋 Processing {len(uploaded_files)} Resume(s)")
     
     # Progress bar
     progress_bar = st.progress(0)
     status_text = st.empty()
+    status_text.text(f"Processing {len(uploaded_files)} file(s)...")
     
-    for i, uploaded_file in enumerate(uploaded_files):
-        status_text.text(f"Processing: {uploaded_file.name}")
-        
-        # Read file
-        file_bytes = uploaded_file.read()
-        
-        # Parse and analyze
-        text = wrapper.parse_resume(file_bytes, uploaded_file.name)
-        analysis = wrapper.analyze_resume(text, position)
-        
-        # Add filename and text preview
-        analysis["filename"] = uploaded_file.name
-        analysis["text_preview"] = text[:500] + "..." if len(text) > 500 else text
-        all_results.append(analysis)
-        
-        # Update progress
-        progress_bar.progress((i + 1) / len(uploaded_files))
+    # Hash uploads in place; parsing and analysis run in worker threads. Uncached
+    # PDF/DOCX files are copied to bytes once to hand them to a parse worker process.
+    # Hashes are kept in session state by file_id, so reruns don't re-hash unchanged uploads.
+    known_keys = st.session_state.get("upload_keys", {})
+    upload_keys = {f.file_id: known_keys.get(f.file_id) or upload_key(f) for f in uploaded_files}
+    st.session_state["upload_keys"] = upload_keys
+    uploads = [(upload_keys[f.file_id], f, f.name) for f in uploaded_files]
+    
+    def show_progress(done, filename):
+        status_text.text(f"Processed: {filename}")
+        progress_bar.progress(done / len(uploads))
+    
+    # Progress is drawn here in script code; on reruns every file is a parse/analysis cache hit
+    all_results = screen_uploads(wrapper, uploads, position, show_progress)
+    
+    # The sorted frame is cached per batch, so slider and checkbox changes reuse it
+    batch_hash = upload_batch_hash(uploads)
+    df = results_frame(wrapper.mode, batch_hash, position, all_results)
     
     status_text.text("✅ Processing complete!")
     
-    if all_results:
-        # Create DataFrame
-        df = pd.DataFrame(all_results)
-        
-        # Sort by score
-        df = df.sort_values("score", ascending=False)
-        
+    if not df.empty:
         # Display metrics
         st.markdown("## 📊 Screening Results")
         
@@ -393,33 +720,21 @@ if uploaded_files:
         tab1, tab2, tab3 = st.tabs(["Score Distribution", "Skills Analysis", "Top Candidates"])
         
         with tab1:
-            # Score distribution chart
-            fig = px.histogram(df, x="score", nbins=20, 
-                              title="Score Distribution Across Candidates",
-                              labels={"score": "Score", "count": "Number of Candidates"})
-            fig.update_layout(bargap=0.1)
+            # Score distribution and score vs experience, in one chart
+            fig = go.Figure(make_score_overview(tuple(df["score"].tolist()),
+                                                tuple(df["experience_years"].tolist()),
+                                                tuple(df["skills_match"].tolist()),
+                                                tuple(df["filename"].tolist())))
             st.plotly_chart(fig, width="stretch")
-            
-            # Score vs Experience
-            fig2 = px.scatter(df, x="experience_years", y="score", 
-                             size="skills_match", hover_data=["filename"],
-                             title="Score vs Experience (bubble size = skills match %)",
-                             labels={"experience_years": "Years of Experience", 
-                                    "score": "Score", "skills_match": "Skills Match %"})
-            st.plotly_chart(fig2, width="stretch")
         
         with tab2:
             # Skills frequency
-            all_skills = []
-            for skills in df["skills"]:
-                all_skills.extend(skills)
+            top_skills = Counter(chain.from_iterable(df["skills"])).most_common(15)
             
-            if all_skills:
-                skills_df = pd.DataFrame({"skill": all_skills})
-                skills_count = skills_df["skill"].value_counts().reset_index()
-                skills_count.columns = ["skill", "count"]
+            if top_skills:
+                skills_count = pd.DataFrame(top_skills, columns=["skill", "count"])
                 
-                fig3 = px.bar(skills_count.head(15), x="skill", y="count",
+                fig3 = px.bar(skills_count, x="skill", y="count",
                              title="Most Common Skills Across All Resumes")
                 st.plotly_chart(fig3, width="stretch")
             
@@ -436,70 +751,41 @@ if uploaded_files:
             
             top_candidates = df.head(top_n)
             
-            for idx, row in top_candidates.iterrows():
-                with st.container():
-                    st.markdown(f"""
-                    <div class="candidate-card">
-                        <h4>{row['filename']} - <span style="color: #3B82F6;">{row['score']}/100</span></h4>
-                        <p><strong>Experience:</strong> {row['experience_years']} years | 
-                        <strong>Education:</strong> {row['education_level']} | 
-                        <strong>Skills Match:</strong> {row['skills_match']}%</p>
-                        <p><strong>Top Skills:</strong> {', '.join(row['skills'][:5])}</p>
-                        <details>
-                            <summary>View Summary</summary>
-                            <p>{row['summary']}</p>
-                        </details>
-                    </div>
-                    """, unsafe_allow_html=True)
-                    
-                    # Show detailed analysis if enabled
-                    if show_details:
-                        with st.expander("📊 Detailed Analysis"):
-                            col_a, col_b = st.columns(2)
-                            with col_a:
-                                st.write("**Score Breakdown:**")
-                                st.write(f"- Base score: 50")
-                                st.write(f"- Skills bonus: +{row['score'] - 50}")
-                                st.write(f"- Experience bonus: +{min(row['experience_years'] * 3, 20)}")
-                                
-                                # Create gauge chart for score
-                                fig_gauge = go.Figure(go.Indicator(
-                                    mode="gauge+number",
-                                    value=row['score'],
-                                    title={'text': "Score"},
-                                    domain={'x': [0, 1], 'y': [0, 1]},
-                                    gauge={
-                                        'axis': {'range': [0, 100]},
-                                        'bar': {'color': "#3B82F6"},
-                                        'steps': [
-                                            {'range': [0, 60], 'color': "lightgray"},
-                                            {'range': [60, 80], 'color': "lightblue"},
-                                            {'range': [80, 100], 'color': "lightgreen"}
-                                        ]
-                                    }
-                                ))
-                                st.plotly_chart(fig_gauge, width="stretch")
-                            
-                            with col_b:
-                                st.write("**Skills Analysis:**")
-                                skills_df = pd.DataFrame({
-                                    "skill": row['skills'],
-                                    "weight": [wrapper.screener.skill_weights.get(skill, 1) 
-                                             for skill in row['skills']]
-                                })
-                                if not skills_df.empty:
-                                    fig_skills = px.bar(skills_df.head(8), x="skill", y="weight",
-                                                       title="Skill Weights")
-                                    st.plotly_chart(fig_skills, width="stretch")
+            # All cards in a single markdown element instead of one per candidate
+            st.markdown("\n".join(candidate_card_html(row) for _, row in top_candidates.iterrows()),
+                        unsafe_allow_html=True)
+            
+            # Show detailed analysis if enabled
+            if show_details:
+                # Look up skill weights for all shown candidates at once, then split by row
+                # (the LLM screener has no skill weights, so every skill counts as 1)
+                skill_weights = getattr(wrapper.screener, "skill_weights", {})
+                skills_long = top_candidates["skills"].explode().dropna().to_frame("skill")
+                skills_long["weight"] = skills_long["skill"].map(skill_weights).fillna(1).astype(int)
+                skills_by_row = dict(tuple(skills_long.groupby(level=0)))
+                
+                for idx, row in top_candidates.iterrows():
+                    with st.expander(f"📊 Detailed Analysis: {row['filename']}"):
+                        st.write("**Score Breakdown:**")
+                        st.write(f"- Base score: 50")
+                        st.write(f"- Skills bonus: +{row['score'] - 50}")
+                        st.write(f"- Experience bonus: +{min(row['experience_years'] * 3, 20)}")
+                        
+                        # Score gauge and skill weights in one chart
+                        skills_df = skills_by_row.get(idx)
+                        shown_skills = skills_df.head(8) if skills_df is not None else None
+                        fig_candidate = go.Figure(make_candidate_figure(
+                            row['score'],
+                            tuple(shown_skills["skill"]) if shown_skills is not None else (),
+                            tuple(shown_skills["weight"].tolist()) if shown_skills is not None else ()
+                        ))
+                        st.plotly_chart(fig_candidate, width="stretch")
         
         # Download results
         st.markdown("## 📥 Download Results")
         
-        # Convert DataFrame to CSV
-        csv = df.to_csv(index=False).encode('utf-8')
-        
-        # Convert to JSON
-        json_data = df.to_json(orient='records', indent=2)
+        # CSV and JSON exports (cached per batch)
+        csv, json_data = export_results(wrapper.mode, batch_hash, position, df)
         
         col1, col2 = st.columns(2)
         
@@ -521,97 +807,37 @@ if uploaded_files:
         
 else:
     # Check for email results
-    import glob
-    
     try:
-        results_files = glob.glob(os.path.join("./email_results", "*.json"))
-        if results_files:
-            all_results = []
+        final_results = load_email_results(email_results_signatures())
+        
+        if final_results:
+            import pandas as pd
             
-            # Load all files
-            for file in results_files:
-                with open(file, 'r') as f:
-                    data = json.load(f)
-                    if data.get("results"):
-                        for r in data["results"]:
-                            all_results.append(r)
-                            
-            # Deduplicate
-            unique_results = {}
-            for r in all_results:
-                key = r.get("candidate_id", f"{r['email_data']['from']}_{r['resume_info']['target_position']}")
-                unique_results[key] = r
+            st.markdown(f"## 📧 Email Screening Results (history)")
             
-            final_results = list(unique_results.values())
+            # Metrics
+            status_counts = Counter(r["screening_results"]["status"] for r in final_results)
+            m1, m2, m3, m4 = st.columns(4)
+            m1.metric("Total Candidates", len(final_results))
+            m2.metric("Accepted", status_counts["Accepted"])
+            m3.metric("Needs Review", status_counts["Needs Review"])
+            m4.metric("Rejected", status_counts["Rejected"])
             
-            if final_results:
-                st.markdown(f"## 📧 Email Screening Results (history)")
-                
-                # Metrics
-                m1, m2, m3, m4 = st.columns(4)
-                m1.metric("Total Candidates", len(final_results))
-                m2.metric("Accepted", len([r for r in final_results if r["screening_results"]["status"] == "Accepted"]))
-                m3.metric("Needs Review", len([r for r in final_results if r["screening_results"]["status"] == "Needs Review"]))
-                m4.metric("Rejected", len([r for r in final_results if r["screening_results"]["status"] == "Rejected"]))
-                
-                # Convert to DataFrame
-                email_rows = []
-                for r in final_results:
-                    email_rows.append({
-                        "Name": r["email_data"]["sender_name"],
-                        "Email": r["email_data"]["from"],
-                        "Subject": r["email_data"]["subject"],
-                        "Position": r["resume_info"]["target_position"],
-                        "Score": r["screening_results"]["score"],
-                        "Status": r["screening_results"]["status"],
-                        "Exp (Yrs)": r["screening_results"]["experience_years"],
-                        "Date": r["screening_results"].get("screened_date", "")[:10]
-                    })
-                
-                df_email = pd.DataFrame(email_rows)
-                
-                # Show All Candidates first
-                st.subheader("📋 All Candidates History")
-                st.dataframe(df_email, width="stretch")
-                
-                st.divider()
-                
-                # Filter Section
-                st.subheader("🔍 Filter Candidates")
-                
-                col_f1, col_f2 = st.columns(2)
-                with col_f1:
-                    status_filter = st.multiselect(
-                        "Filter by Status",
-                        ["Accepted", "Rejected", "Needs Review"],
-                        default=["Accepted", "Needs Review"]
-                    )
-                
-                # Default filter by selected position
-                default_pos_filter = [position]
-                if position not in df_email["Position"].unique():
-                     default_pos_filter = []
-                     
-                with col_f2:
-                    pos_filter = st.multiselect(
-                        "Filter by Position",
-                        df_email["Position"].unique(),
-                        default=[p for p in default_pos_filter if p in df_email["Position"].unique()]
-                    )
-                
-                # Apply filters
-                df_filtered = df_email.copy()
-                if status_filter:
-                    df_filtered = df_filtered[df_filtered["Status"].isin(status_filter)]
-                if pos_filter:
-                    df_filtered = df_filtered[df_filtered["Position"].isin(pos_filter)]
-                
-                st.write(f"Showing {len(df_filtered)} filtered candidates:")
-                st.dataframe(df_filtered, width="stretch")
-            else:
-                st.info("No resumes found in email history.")
+            # Flatten the nested results in one pass, then pick and rename columns
+            df_email = (pd.json_normalize(final_results)
+                        .reindex(columns=list(EMAIL_HISTORY_COLUMNS))
+                        .rename(columns=EMAIL_HISTORY_COLUMNS))
+            df_email["Date"] = df_email["Date"].fillna("").str[:10]
+            
+            # Show All Candidates first
+            st.subheader("📋 All Candidates History")
+            st.dataframe(df_email, width="stretch")
+            
+            st.divider()
+            
+            render_email_filters(df_email, position)
         else:
-             st.info("No email results found.")
+            st.info("No email results found.")
 
     except Exception as e:
         st.error(f"Error loading email results: {e}")